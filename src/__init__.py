@@ -1,38 +1,36 @@
-from .agent import GeneralPurposeAgent
-from .planning import Plan, SubTask, PlanningModule
-from .thinking import ThinkingModule, Thought
-from .execution import ExecutionEngine, ExecutionResult
-from .evaluation import EvaluationModule, StepEvaluation, FinalEvaluation
-from .memory import WorkingMemory, LongTermMemory
-from .tools import (
-    Tool,
-    ToolRegistry,
-    FileReadTool,
-    FileWriteTool,
-    FileListTool,
-    PythonExecuteTool,
-    WebSearchTool,
-)
+import importlib
 
-__all__ = [
-    'GeneralPurposeAgent',
-    'Plan',
-    'SubTask',
-    'PlanningModule',
-    'ThinkingModule',
-    'Thought',
-    'ExecutionEngine',
-    'ExecutionResult',
-    'EvaluationModule',
-    'StepEvaluation',
-    'FinalEvaluation',
-    'WorkingMemory',
-    'LongTermMemory',
-    'Tool',
-    'ToolRegistry',
-    'FileReadTool',
-    'FileWriteTool',
-    'FileListTool',
-    'PythonExecuteTool',
-    'WebSearchTool',
-]
+# Exports are resolved lazily (PEP 562) so importing one submodule, e.g.
+# src.planning or src.tools, doesn't pull in the agent and the OpenAI SDK
+_EXPORTS = {
+    'GeneralPurposeAgent': '.agent',
+    'Plan': '.planning',
+    'SubTask': '.planning',
+    'PlanningModule': '.planning',
+    'ThinkingModule': '.thinking',
+    'Thought': '.thinking',
+    'ExecutionEngine': '.execution',
+    'ExecutionResult': '.execution',
+    'EvaluationModule': '.evaluation',
+    'StepEvaluation': '.evaluation',
+    'FinalEvaluation': '.evaluation',
+    'WorkingMemory': '.memory',
+    'LongTermMemory': '.memory',
+    'Tool': '.tools',
+    'ToolRegistry': '.tools',
+    'FileReadTool': '.tools',
+    'FileWriteTool': '.tools',
+    'FileListTool': '.tools',
+    'PythonExecuteTool': '.tools',
+    'WebSearchTool': '.tools',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
@@ -1,6 +1,8 @@
 """Main Agent class integrating all modules."""
+import asyncio
 import yaml
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from .utils.llm_client import AzureOpenAIClient
@@ -19,14 +21,41 @@ from .tools import (
 )
 
 
+DEFAULT_CONFIG = {
+    'agent': {
+        'name': 'GeneralPurposeAgent',
+        'max_iterations': 10,
+        'thinking_enabled': True,
+        'verbose': True
+    },
+    'llm': {
+        'temperature': 0.7,
+        'max_tokens': 4096
+    },
+    'planning': {
+        'max_subtasks': 20,
+        'allow_replanning': True
+    },
+    'evaluation': {
+        'step_evaluation': True,
+        'final_evaluation': True,
+        'success_threshold': 0.7
+    }
+}
+
+
 class GeneralPurposeAgent:
     """A general-purpose agent with planning, thinking, execution, and evaluation capabilities."""
 
+    # Shared by all agents so parallel subtasks stay bounded however many agents run at once
+    _subtask_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="subtask")
+
     def __init__(
         self,
         config_path: Optional[str] = None,
         config: Optional[Dict[str, Any]] = None,
-        verbose: bool = True
+        verbose: bool = True,
+        llm_client: Optional[AzureOpenAIClient] = None
     ):
         """Initialize the agent.
 
@@ -34,6 +63,7 @@ class GeneralPurposeAgent:
             config_path: Path to configuration file
             config: Configuration dictionary (overrides config_path)
             verbose: Whether to print detailed output
+            llm_client: Shared LLM client to reuse (the 'llm' config section is ignored when given)
         """
         # Load configuration
         if config:
@@ -43,33 +73,13 @@ class GeneralPurposeAgent:
                 self.config = yaml.safe_load(f)
         else:
             # Default configuration
-            self.config = {
-                'agent': {
-                    'name': 'GeneralPurposeAgent',
-                    'max_iterations': 10,
-                    'thinking_enabled': True,
-                    'verbose': verbose
-                },
-                'llm': {
-                    'temperature': 0.7,
-                    'max_tokens': 4096
-                },
-                'planning': {
-                    'max_subtasks': 20,
-                    'allow_replanning': True
-                },
-                'evaluation': {
-                    'step_evaluation': True,
-                    'final_evaluation': True,
-                    'success_threshold': 0.7
-                }
-            }
+            self.config = self.default_config(verbose)
 
         self.verbose = self.config['agent'].get('verbose', verbose)
         self.thinking_enabled = self.config['agent'].get('thinking_enabled', True)
 
         # Initialize LLM client
-        self.llm_client = AzureOpenAIClient(
+        self.llm_client = llm_client or AzureOpenAIClient(
             temperature=self.config['llm'].get('temperature', 0.7),
             max_tokens=self.config['llm'].get('max_tokens', 4096)
         )
@@ -108,6 +118,29 @@ class GeneralPurposeAgent:
         # Current plan
         self.current_plan: Optional[Plan] = None
 
+        # Evaluation from the most recent run_stream()
+        self.last_evaluation: Optional[FinalEvaluation] = None
+
+    @staticmethod
+    def default_config(verbose: bool = True, overrides: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Build the default configuration.
+
+        Args:
+            verbose: Whether to print detailed output
+            overrides: Partial configuration merged over the defaults, section by section
+
+        Returns:
+            Configuration dictionary
+        """
+        overrides = overrides or {}
+        config = {
+            section: {**values, **overrides.get(section, {})}
+            for section, values in DEFAULT_CONFIG.items()
+        }
+        if 'verbose' not in overrides.get('agent', {}):
+            config['agent']['verbose'] = verbose
+        return config
+
     def _register_default_tools(self):
         """Register default tools."""
         self.tool_registry.register(FileReadTool())
@@ -169,65 +202,66 @@ class GeneralPurposeAgent:
         step_evaluations: List[StepEvaluation] = []
         completed_subtasks: List[int] = []
 
-        for subtask in self.current_plan.subtasks:
-            # Check dependencies
-            if not all(dep in completed_subtasks for dep in subtask.dependencies):
-                if self.verbose:
-                    print(f"\nSkipping subtask {subtask.id} - dependencies not met")
-                continue
-
-            if self.verbose:
-                print(f"\n{'─'*60}")
-                print(f"Executing Subtask {subtask.id}: {subtask.description}")
-                print(f"{'─'*60}")
-
-            # Execute the subtask
-            result = self.execution_engine.execute_task(
-                task_description=subtask.description,
-                context=context
-            )
-
-            subtask.status = "completed" if result.success else "failed"
-            subtask.result = {
-                "success": result.success,
-                "output": result.output,
-                "error": result.error
-            }
-
-            # Phase 3: Step Evaluation
-            if self.config['evaluation'].get('step_evaluation', True):
-                step_eval = self.evaluation_module.evaluate_step(
-                    step_id=subtask.id,
-                    step_description=subtask.description,
-                    expected_outcome=subtask.reasoning,
-                    actual_result=subtask.result
-                )
-                step_evaluations.append(step_eval)
-
-                if self.verbose:
-                    self.evaluation_module.print_step_evaluation(step_eval)
-
-            if result.success:
-                completed_subtasks.append(subtask.id)
+        # Run subtasks in dependency waves: every subtask whose dependencies have
+        # completed runs concurrently with its siblings on the shared subtask pool,
+        # so latency follows the plan's critical path rather than the number of subtasks
+        remaining = list(self.current_plan.subtasks)
+
+        while remaining:
+            wave, blocked = [], []
+            for subtask in remaining:
+                ready = all(dep in completed_subtasks for dep in subtask.dependencies)
+                (wave if ready else blocked).append(subtask)
+
+            if not wave:
+                break
+            remaining = blocked
+
+            # While streaming (run_stream), siblings share one token callback, so
+            # run them one at a time to keep each subtask's output contiguous
+            if len(wave) == 1 or self.execution_engine.on_token:
+                outcomes = [self._execute_subtask(subtask, context) for subtask in wave]
             else:
-                # Handle failure
-                if self.thinking_enabled:
-                    self.thinking_module.analyze_failure(
-                        task=subtask.description,
-                        error=result.error or "Unknown error",
-                        attempts=1
-                    )
-
-                # Optionally replan
-                if self.config['planning'].get('allow_replanning', True):
+                outcomes = list(self._subtask_executor.map(
+                    lambda subtask: self._execute_subtask(subtask, context), wave
+                ))
+
+            # Record results in plan order
+            for subtask, (result, step_eval) in zip(wave, outcomes):
+                if step_eval is not None:
+                    step_evaluations.append(step_eval)
+
                     if self.verbose:
-                        print("\n[REPLANNING due to failure...]")
+                        self.evaluation_module.print_step_evaluation(step_eval)
+
+                if result.success:
+                    completed_subtasks.append(subtask.id)
+                else:
+                    # Handle failure
+                    if self.thinking_enabled:
+                        self.thinking_module.analyze_failure(
+                            task=subtask.description,
+                            error=result.error or "Unknown error",
+                            attempts=1
+                        )
+
+                    # Optionally replan
+                    if self.config['planning'].get('allow_replanning', True):
+                        if self.verbose:
+                            print("\n[REPLANNING due to failure...]")
+
+                        self.current_plan = self.planning_module.replan(
+                            original_plan=self.current_plan,
+                            completed_subtasks=completed_subtasks,
+                            failure_reason=result.error or "Task failed"
+                        )
 
-                    self.current_plan = self.planning_module.replan(
-                        original_plan=self.current_plan,
-                        completed_subtasks=completed_subtasks,
-                        failure_reason=result.error or "Task failed"
-                    )
+        if self.verbose:
+            for subtask in remaining:
+                print(f"\nSkipping subtask {subtask.id} - dependencies not met")
+
+        # Waves can finish out of plan order; report steps in step_id order
+        step_evaluations.sort(key=lambda step_eval: step_eval.step_id)
 
         # Phase 4: Final Evaluation
         if self.verbose:
@@ -245,8 +279,8 @@ class GeneralPurposeAgent:
         # Save to long-term memory
         self.long_term_memory.save_task({
             'goal': goal,
-            'plan': self.current_plan.dict(),
-            'evaluation': final_evaluation.dict()
+            'plan': self.current_plan.model_dump(),
+            'evaluation': final_evaluation.model_dump()
         })
 
         # Clear working memory
@@ -257,6 +291,87 @@ class GeneralPurposeAgent:
 
         return final_evaluation
 
+    def _execute_subtask(
+        self,
+        subtask: SubTask,
+        context: Optional[str]
+    ) -> Tuple[ExecutionResult, Optional[StepEvaluation]]:
+        """Execute one subtask and evaluate the step.
+
+        Args:
+            subtask: Subtask to execute (its status and result are updated)
+            context: Additional context information
+
+        Returns:
+            Tuple of (execution result, step evaluation or None when disabled)
+        """
+        if self.verbose:
+            print(f"\n{'─'*60}")
+            print(f"Executing Subtask {subtask.id}: {subtask.description}")
+            print(f"{'─'*60}")
+
+        # Execute the subtask
+        result = self.execution_engine.execute_task(
+            task_description=subtask.description,
+            context=context
+        )
+
+        subtask.status = "completed" if result.success else "failed"
+        subtask.result = {
+            "success": result.success,
+            "output": result.output,
+            "error": result.error
+        }
+
+        # Phase 3: Step Evaluation
+        step_eval = None
+        if self.config['evaluation'].get('step_evaluation', True):
+            step_eval = self.evaluation_module.evaluate_step(
+                step_id=subtask.id,
+                step_description=subtask.description,
+                expected_outcome=subtask.reasoning,
+                actual_result=subtask.result
+            )
+
+        return result, step_eval
+
+    async def run_stream(self, goal: str, context: Optional[str] = None) -> AsyncIterator[str]:
+        """Run the agent, yielding execution output tokens as they are generated.
+
+        The workflow runs in a worker thread; the execution engine streams
+        each completion and forwards text to this generator. The final
+        evaluation is stored in `last_evaluation` once the stream ends.
+
+        Args:
+            goal: The goal to achieve
+            context: Additional context information
+
+        Yields:
+            Text fragments from the execution phase
+        """
+        loop = asyncio.get_running_loop()
+        tokens: asyncio.Queue = asyncio.Queue()
+
+        def on_token(token: str):
+            try:
+                loop.call_soon_threadsafe(tokens.put_nowait, token)
+            except RuntimeError:
+                # The consumer stopped early and its event loop is already closed
+                pass
+
+        self.execution_engine.on_token = on_token
+        future = loop.run_in_executor(None, self.run, goal, context)
+        future.add_done_callback(lambda _: tokens.put_nowait(None))
+
+        try:
+            while (token := await tokens.get()) is not None:
+                yield token
+        finally:
+            # Detach even if the consumer stopped early; the engine stops forwarding
+            self.execution_engine.on_token = None
+
+        self.last_evaluation = await future
+
     def quick_task(self, task: str) -> ExecutionResult:
         """Execute a simple task without full planning and evaluation.
 
@@ -108,7 +108,7 @@ class AgentOrchestrator:
                 to_agent='all',
                 role=AgentRole.PLANNER,
                 content=f"Plan created with {len(plan_result.subtasks)} subtasks",
-                metadata={'plan': plan_result.dict()}
+                metadata={'plan': plan_result.model_dump()}
             )
             self.send_message(message)
 
@@ -1,8 +1,10 @@
 """Evaluation module for assessing task and step results."""
 import json
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, TYPE_CHECKING
 from pydantic import BaseModel
-from .utils.llm_client import AzureOpenAIClient
+
+if TYPE_CHECKING:
+    from .utils.llm_client import AzureOpenAIClient
 
 
 class StepEvaluation(BaseModel):
@@ -33,7 +35,7 @@ class EvaluationModule:
 
     def __init__(
         self,
-        llm_client: AzureOpenAIClient,
+        llm_client: "AzureOpenAIClient",
         success_threshold: float = 0.7
     ):
         """Initialize the evaluation module.
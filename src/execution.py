@@ -1,6 +1,6 @@
 """Execution engine for running tasks with tools."""
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Callable, Iterable, Iterator
 from .utils.llm_client import AzureOpenAIClient
 from .tools.base import ToolRegistry
 from .thinking import ThinkingModule
@@ -30,7 +30,8 @@ class ExecutionEngine:
         llm_client: AzureOpenAIClient,
         tool_registry: ToolRegistry,
         thinking_module: Optional[ThinkingModule] = None,
-        max_iterations: int = 10
+        max_iterations: int = 10,
+        on_token: Optional[Callable[[str], None]] = None
     ):
         """Initialize the execution engine.
 
@@ -39,11 +40,25 @@ class ExecutionEngine:
             tool_registry: Registry of available tools
             thinking_module: Optional thinking module
             max_iterations: Maximum iterations per task
+            on_token: Optional callback receiving response text as it streams in
         """
         self.llm_client = llm_client
         self.tool_registry = tool_registry
         self.thinking_module = thinking_module
         self.max_iterations = max_iterations
+        self.on_token = on_token
+
+    def _forward_tokens(self, deltas: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """Pass streamed content to on_token while yielding deltas for aggregation.
+
+        on_token is re-read for every delta, so forwarding stops mid-completion
+        once the consumer detaches by resetting it to None.
+        """
+        for delta in deltas:
+            on_token = self.on_token
+            if on_token and delta["content"]:
+                on_token(delta["content"])
+            yield delta
 
     def execute_task(
         self,
@@ -99,11 +114,19 @@ You can use multiple tools in sequence to accomplish complex tasks. Always provi
         while iterations < self.max_iterations:
             iterations += 1
 
-            # Get response from LLM
-            response = self.llm_client.chat_completion(
-                messages=messages,
-                tools=self.tool_registry.to_openai_format()
-            )
+            # Get response from LLM, streaming text out as it arrives when requested
+            if self.on_token:
+                deltas = self.llm_client.chat_completion(
+                    messages=messages,
+                    tools=self.tool_registry.to_openai_format(),
+                    stream=True
+                )
+                response = self.llm_client.aggregate_stream(self._forward_tokens(deltas))
+            else:
+                response = self.llm_client.chat_completion(
+                    messages=messages,
+                    tools=self.tool_registry.to_openai_format()
+                )
 
             message = response.choices[0].message
             finish_reason = response.choices[0].finish_reason
@@ -118,7 +141,9 @@ You can use multiple tools in sequence to accomplish complex tasks. Always provi
                 assistant_message["tool_calls"] = tool_calls
                 messages.append(assistant_message)
 
-                # Execute each tool call
+                # Parse arguments and start every tool call on the shared pool
+                # so independent IO-bound tools run concurrently
+                pending = []
                 for tool_call in tool_calls:
                     tool_name = tool_call["function"]["name"]
                     tool_args_str = tool_call["function"]["arguments"]
@@ -128,14 +153,20 @@ You can use multiple tools in sequence to accomplish complex tasks. Always provi
                     except json.JSONDecodeError:
                         tool_args = {}
 
-                    # Get and execute the tool
                     tool = self.tool_registry.get(tool_name)
+                    future = None
 
                     if tool:
                         print(f"\n[Executing tool: {tool_name}]")
                         print(f"Arguments: {tool_args}")
+                        future = tool.execute_async(**tool_args)
+
+                    pending.append((tool_call, tool_name, tool_args, future))
 
-                        result = tool.execute(**tool_args)
+                # Collect results in the order the LLM requested them
+                for tool_call, tool_name, tool_args, future in pending:
+                    if future is not None:
+                        result = future.result()
                         tool_calls_made.append({
                             "tool": tool_name,
                             "args": tool_args,
@@ -1,8 +1,10 @@
 """Planning module for task decomposition."""
 import json
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from pydantic import BaseModel
-from .utils.llm_client import AzureOpenAIClient
+
+if TYPE_CHECKING:
+    from .utils.llm_client import AzureOpenAIClient
 
 
 class SubTask(BaseModel):
@@ -23,10 +25,43 @@ class Plan(BaseModel):
     created_at: str
 
 
+PLANNING_PROMPT_TEMPLATE = """You are an expert planning agent. Your task is to decompose complex goals into clear, actionable subtasks.
+
+Rules:
+1. Break down the goal into {max_subtasks} or fewer subtasks
+2. Each subtask should be specific and actionable
+3. Identify dependencies between subtasks
+4. Provide reasoning for each subtask
+5. Define a high-level strategy
+
+Output your plan as valid JSON with this structure:
+{{
+    "strategy": "Overall strategy description",
+    "subtasks": [
+        {{
+            "id": 1,
+            "description": "Subtask description",
+            "reasoning": "Why this subtask is needed",
+            "dependencies": [0]  // IDs of subtasks that must complete first
+        }}
+    ]
+}}"""
+
+REPLANNING_PROMPT = """You are an expert planning agent. A previous plan has encountered issues and needs to be revised.
+
+Analyze the situation and create an updated plan that:
+1. Preserves completed subtasks
+2. Addresses the failure
+3. Adds new subtasks if needed
+4. Adjusts the strategy
+
+Output your updated plan in the same JSON format as before."""
+
+
 class PlanningModule:
     """Module for decomposing complex tasks into subtasks."""
 
-    def __init__(self, llm_client: AzureOpenAIClient, max_subtasks: int = 20):
+    def __init__(self, llm_client: "AzureOpenAIClient", max_subtasks: int = 20):
         """Initialize the planning module.
 
         Args:
@@ -35,6 +70,8 @@ class PlanningModule:
         """
         self.llm_client = llm_client
         self.max_subtasks = max_subtasks
+        # Specialize the template once; only the user prompt varies per call
+        self.system_prompt = PLANNING_PROMPT_TEMPLATE.format(max_subtasks=max_subtasks)
 
     def create_plan(self, goal: str, context: Optional[str] = None) -> Plan:
         """Create a plan for achieving the goal.
@@ -46,28 +83,6 @@ class PlanningModule:
         Returns:
             A Plan object with subtasks
         """
-        system_prompt = f"""You are an expert planning agent. Your task is to decompose complex goals into clear, actionable subtasks.
-
-Rules:
-1. Break down the goal into {self.max_subtasks} or fewer subtasks
-2. Each subtask should be specific and actionable
-3. Identify dependencies between subtasks
-4. Provide reasoning for each subtask
-5. Define a high-level strategy
-
-Output your plan as valid JSON with this structure:
-{{
-    "strategy": "Overall strategy description",
-    "subtasks": [
-        {{
-            "id": 1,
-            "description": "Subtask description",
-            "reasoning": "Why this subtask is needed",
-            "dependencies": [0]  // IDs of subtasks that must complete first
-        }}
-    ]
-}}"""
-
         user_prompt = f"""Goal: {goal}
 
 {f'Context: {context}' if context else ''}
@@ -75,7 +90,7 @@ Output your plan as valid JSON with this structure:
 Please create a detailed plan to achieve this goal."""
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": self.system_prompt},
             {"role": "user", "content": user_prompt}
         ]
 
@@ -137,28 +152,18 @@ Please create a detailed plan to achieve this goal."""
         Returns:
             Updated Plan
         """
-        system_prompt = """You are an expert planning agent. A previous plan has encountered issues and needs to be revised.
-
-Analyze the situation and create an updated plan that:
-1. Preserves completed subtasks
-2. Addresses the failure
-3. Adds new subtasks if needed
-4. Adjusts the strategy
-
-Output your updated plan in the same JSON format as before."""
-
         user_prompt = f"""Original Goal: {original_plan.goal}
 Original Strategy: {original_plan.strategy}
 Completed Subtasks: {completed_subtasks}
 Failure Reason: {failure_reason}
 
 Original Subtasks:
-{json.dumps([task.dict() for task in original_plan.subtasks], indent=2)}
+{json.dumps([task.model_dump() for task in original_plan.subtasks], indent=2)}
 
 Please create an updated plan to continue towards the goal."""
 
         messages = [
-            {"role": "system", "content": system_prompt},
+            {"role": "system", "content": REPLANNING_PROMPT},
             {"role": "user", "content": user_prompt}
         ]
 
@@ -3,7 +3,8 @@ from enum import Enum
 from typing import Generator, Callable, Any, Optional, Dict
 from dataclasses import dataclass, field
 from datetime import datetime
-import json
+
+import orjson
 
 
 class StreamEventType(Enum):
@@ -38,20 +39,26 @@ class StreamEvent:
         }
 
     def to_json(self) -> str:
-        """Convert to JSON string."""
-        return json.dumps(self.to_dict())
+        """Convert to JSON string (compact, encoded with orjson)."""
+        return orjson.dumps(self.to_dict()).decode()
 
     def to_sse(self) -> str:
         """Convert to Server-Sent Events format."""
         return f"data: {self.to_json()}\n\n"
 
+    def to_sse_bytes(self) -> bytes:
+        """Convert to Server-Sent Events format as bytes, encoded with orjson."""
+        return b"data: " + orjson.dumps(self.to_dict()) + b"\n\n"
+
 
 class StreamHandler:
     """Handler for streaming agent responses."""
 
     def __init__(self):
         """Initialize stream handler."""
-        self.subscribers: list[Callable[[StreamEvent], None]] = []
+        # Immutable snapshot, rebuilt only on (un)subscribe so emit() iterates
+        # a tuple and callbacks may (un)subscribe safely during dispatch
+        self.subscribers: tuple[Callable[[StreamEvent], None], ...] = ()
         self.event_history: list[StreamEvent] = []
 
     def subscribe(self, callback: Callable[[StreamEvent], None]):
@@ -60,7 +67,7 @@ class StreamHandler:
         Args:
             callback: Function to call with each event
         """
-        self.subscribers.append(callback)
+        self.subscribers = (*self.subscribers, callback)
 
     def unsubscribe(self, callback: Callable[[StreamEvent], None]):
         """Unsubscribe from stream events.
@@ -69,7 +76,9 @@ class StreamHandler:
             callback: Function to remove
         """
         if callback in self.subscribers:
-            self.subscribers.remove(callback)
+            subscribers = list(self.subscribers)
+            subscribers.remove(callback)
+            self.subscribers = tuple(subscribers)
 
     def emit(self, event: StreamEvent):
         """Emit an event to all subscribers.
@@ -1,7 +1,9 @@
 """Thinking module for reasoning and reflection."""
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, TYPE_CHECKING
 from pydantic import BaseModel
-from .utils.llm_client import AzureOpenAIClient
+
+if TYPE_CHECKING:
+    from .utils.llm_client import AzureOpenAIClient
 
 
 class Thought(BaseModel):
@@ -14,7 +16,7 @@ class Thought(BaseModel):
 class ThinkingModule:
     """Module for explicit reasoning and reflection."""
 
-    def __init__(self, llm_client: AzureOpenAIClient, verbose: bool = True):
+    def __init__(self, llm_client: "AzureOpenAIClient", verbose: bool = True):
         """Initialize the thinking module.
 
         Args:
@@ -1,5 +1,8 @@
 """Base classes for tools."""
+import asyncio
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Dict, Any, List, Optional
 from pydantic import BaseModel, Field
 
@@ -16,6 +19,9 @@ class ToolParameter(BaseModel):
 class Tool(ABC):
     """Base class for all tools."""
 
+    # Shared by all tools so parallel tool calls don't each spin up threads
+    _executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix="tool")
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -43,6 +49,27 @@ class Tool(ABC):
         """
         pass
 
+    def execute_async(self, **kwargs) -> Future:
+        """Execute the tool on the shared tool thread pool.
+
+        Returns:
+            Future resolving to the `execute` result dictionary
+        """
+        return self._executor.submit(self.execute, **kwargs)
+
+    async def aexecute(self, **kwargs) -> Dict[str, Any]:
+        """Execute the tool without blocking the event loop.
+
+        Runs `execute` on the shared tool thread pool so blocking IO (e.g.
+        slow or network-mounted disks) from several tool calls can overlap
+        via `asyncio.gather`.
+
+        Returns:
+            Dictionary with 'success' boolean and 'result' or 'error' key
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(self.execute, **kwargs))
+
     def to_openai_format(self) -> Dict[str, Any]:
         """Convert tool definition to OpenAI function calling format."""
         properties = {}
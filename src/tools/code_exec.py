@@ -1,10 +1,44 @@
 """Code execution tools."""
+import math
 import subprocess
 import sys
 from typing import Dict, Any, List
 from .base import Tool, ToolParameter
 
 
+# Resource limits applied inside the child interpreter before user code runs
+MEMORY_LIMIT_BYTES = 512 * 1024 * 1024
+FILE_SIZE_LIMIT_BYTES = 64 * 1024 * 1024
+
+# Bootstrap executed via `-c`: lowers rlimits (POSIX only), then runs the code piped on stdin.
+# The code runs in __main__'s own namespace (so pickling and multiprocessing can find its
+# definitions) with the bootstrap's names removed, and compiles under its own filename.
+USER_CODE_FILENAME = "<execute_python>"
+
+_SANDBOX_BOOTSTRAP = """
+def _bootstrap():
+    import sys
+    try:
+        import resource
+    except ImportError:
+        resource = None
+    if resource is not None:
+        for limit, value in ((resource.RLIMIT_AS, {memory}), (resource.RLIMIT_CPU, {cpu}),
+                             (resource.RLIMIT_FSIZE, {fsize})):
+            soft, hard = resource.getrlimit(limit)
+            if hard != resource.RLIM_INFINITY:
+                value = min(value, hard)
+            try:
+                resource.setrlimit(limit, (value, value))
+            except (ValueError, OSError):
+                pass
+    return compile(sys.stdin.read(), {filename!r}, "exec")
+_code = _bootstrap()
+del _bootstrap
+exec(globals().pop("_code"), globals())
+"""
+
+
 class PythonExecuteTool(Tool):
     """Tool for executing Python code."""
 
@@ -35,12 +69,28 @@ class PythonExecuteTool(Tool):
 
     def execute(self, **kwargs) -> Dict[str, Any]:
         code = kwargs.get("code")
-        timeout = kwargs.get("timeout", 30)
+        timeout = kwargs.get("timeout") or 30
+
+        # The bootstrap reads the code from stdin; never let the child inherit ours
+        if not isinstance(code, str):
+            return {
+                "success": False,
+                "error": "Missing required parameter: code (string)"
+            }
 
         try:
-            # Execute code in a subprocess for safety
+            bootstrap = _SANDBOX_BOOTSTRAP.format(
+                memory=MEMORY_LIMIT_BYTES,
+                cpu=int(math.ceil(timeout)) + 1,
+                fsize=FILE_SIZE_LIMIT_BYTES,
+                filename=USER_CODE_FILENAME
+            )
+
+            # Execute code in a resource-limited subprocess for safety.
+            # The code is piped over stdin, avoiding argv size limits.
             result = subprocess.run(
-                [sys.executable, "-c", code],
+                [sys.executable, "-c", bootstrap],
+                input=code,
                 capture_output=True,
                 text=True,
                 timeout=timeout
@@ -88,16 +88,20 @@ class FileWriteTool(Tool):
 
         try:
             # Create directory if it doesn't exist
-            os.makedirs(os.path.dirname(file_path) or '.', exist_ok=True)
+            directory = os.path.dirname(file_path)
+            if directory and not os.path.isdir(directory):
+                os.makedirs(directory, exist_ok=True)
 
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            # Encode once so the byte count comes for free
+            data = content.encode('utf-8')
+            with open(file_path, 'wb') as f:
+                f.write(data)
 
             return {
                 "success": True,
                 "result": {
                     "file_path": file_path,
-                    "bytes_written": len(content.encode('utf-8'))
+                    "bytes_written": len(data)
                 }
             }
         except Exception as e:
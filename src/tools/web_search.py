@@ -5,6 +5,9 @@ from typing import Dict, Any, List
 from .base import Tool, ToolParameter
 
 
+_PLAIN_CONTENT_TYPES = ('application/json', 'text/plain', 'text/csv')
+
+
 class WebSearchTool(Tool):
     """Tool for fetching and parsing web content."""
 
@@ -37,14 +40,21 @@ class WebSearchTool(Tool):
             response = requests.get(url, headers=headers, timeout=10)
             response.raise_for_status()
 
-            soup = BeautifulSoup(response.text, 'html.parser')
+            # Plain-text payloads need no HTML parsing
+            content_type = response.headers.get('Content-Type', '').split(';')[0].strip().lower()
+            if content_type in _PLAIN_CONTENT_TYPES:
+                text = response.text
+                title = None
+            else:
+                soup = BeautifulSoup(response.text, 'html.parser')
 
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+                # Remove script and style elements
+                for script in soup(["script", "style"]):
+                    script.decompose()
 
-            # Get text
-            text = soup.get_text()
+                # Get text
+                text = soup.get_text()
+                title = soup.title.string if soup.title else None
 
             # Clean up text
             lines = (line.strip() for line in text.splitlines())
@@ -56,7 +66,7 @@ class WebSearchTool(Tool):
                 "result": {
                     "url": url,
                     "content": text[:5000],  # Limit to first 5000 chars
-                    "title": soup.title.string if soup.title else None,
+                    "title": title,
                     "status_code": response.status_code
                 }
             }
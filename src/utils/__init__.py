@@ -1,3 +1,9 @@
-from .llm_client import AzureOpenAIClient
-
 __all__ = ['AzureOpenAIClient']
+
+
+def __getattr__(name):
+    # Lazy so src.utils.query_classifier can be imported without the OpenAI SDK
+    if name == 'AzureOpenAIClient':
+        from .llm_client import AzureOpenAIClient
+        return AzureOpenAIClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,8 +1,59 @@
 """Azure OpenAI Client for LLM interactions."""
+import asyncio
+import atexit
+import json
 import os
-from typing import List, Dict, Any, Optional
-from openai import AzureOpenAI
-from tenacity import retry, stop_after_attempt, wait_exponential
+import random
+import time
+from types import SimpleNamespace
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator, AsyncIterable, AsyncIterator
+import httpx
+from openai import (
+    AzureOpenAI,
+    AsyncAzureOpenAI,
+    APIConnectionError,
+    APITimeoutError,
+    InternalServerError,
+    RateLimitError,
+)
+
+# Transient errors worth retrying; anything else (auth, bad request) fails fast
+_RETRYABLE_ERRORS = (APIConnectionError, APITimeoutError, InternalServerError, RateLimitError)
+_MAX_ATTEMPTS = 3
+
+# Larger batches stop amortizing latency and make per-row answers less reliable
+MAX_BATCH_SIZE = 4
+
+
+_shared_http_client: Optional[httpx.Client] = None
+
+
+def get_shared_http_client() -> httpx.Client:
+    """Return the process-wide HTTP client used by every AzureOpenAIClient.
+
+    Sharing one keep-alive pool means new clients (one per agent, test or
+    request) reuse open TCP/TLS connections instead of handshaking again.
+
+    Returns:
+        Shared httpx.Client, created on first use and closed at exit
+    """
+    global _shared_http_client
+    if _shared_http_client is None:
+        _shared_http_client = httpx.Client(
+            limits=httpx.Limits(
+                max_keepalive_connections=16,
+                max_connections=32,
+                keepalive_expiry=60.0
+            ),
+            timeout=60.0
+        )
+        atexit.register(_shared_http_client.close)
+    return _shared_http_client
+
+
+def _retry_delay(attempt: int) -> float:
+    """Exponential backoff between attempts, capped at 10 seconds, with jitter."""
+    return min(10, 4 * 2 ** attempt) + random.uniform(0, 1)
 
 
 class AzureOpenAIClient:
@@ -16,6 +67,8 @@ class AzureOpenAIClient:
         api_version: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 4096,
+        http_client: Optional[httpx.Client] = None,
+        request_timeout: Optional[float] = None,
     ):
         """Initialize Azure OpenAI client.
 
@@ -26,6 +79,8 @@ class AzureOpenAIClient:
             api_version: API version
             temperature: Sampling temperature
             max_tokens: Maximum tokens in response
+            http_client: HTTP client for sync requests (defaults to the shared pool)
+            request_timeout: Per-request timeout in seconds; timed-out requests are retried
         """
         self.api_key = api_key or os.getenv("AZURE_OPENAI_API_KEY")
         self.endpoint = endpoint or os.getenv("AZURE_OPENAI_ENDPOINT")
@@ -33,6 +88,7 @@ class AzureOpenAIClient:
         self.api_version = api_version or os.getenv("AZURE_OPENAI_API_VERSION", "2024-02-15-preview")
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.request_timeout = request_timeout or float(os.getenv("AZURE_OPENAI_TIMEOUT", 60))
 
         if not all([self.api_key, self.endpoint, self.deployment_name]):
             raise ValueError(
@@ -43,10 +99,72 @@ class AzureOpenAIClient:
         self.client = AzureOpenAI(
             api_key=self.api_key,
             api_version=self.api_version,
-            azure_endpoint=self.endpoint
+            azure_endpoint=self.endpoint,
+            http_client=http_client or get_shared_http_client()
         )
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
+        # Created on first async call; each one owns a connection pool
+        self._async_client: Optional[AsyncAzureOpenAI] = None
+
+    @property
+    def async_client(self) -> AsyncAzureOpenAI:
+        """Async client for overlapping independent completions (e.g. asyncio.gather)."""
+        if self._async_client is None:
+            self._async_client = AsyncAzureOpenAI(
+                api_key=self.api_key,
+                api_version=self.api_version,
+                azure_endpoint=self.endpoint
+            )
+        return self._async_client
+
+    def _build_request(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float],
+        max_tokens: Optional[int],
+        tools: Optional[List[Dict[str, Any]]],
+        tool_choice: Optional[str],
+        stream: bool,
+        request_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Build keyword arguments for a chat completion request."""
+        kwargs = {
+            "model": self.deployment_name,
+            "messages": messages,
+            "temperature": self.temperature if temperature is None else temperature,
+            "max_tokens": max_tokens or self.max_tokens,
+            "timeout": request_timeout or self.request_timeout,
+        }
+
+        if tools:
+            kwargs["tools"] = tools
+            kwargs["tool_choice"] = tool_choice or "auto"
+
+        if stream:
+            kwargs["stream"] = True
+
+        return kwargs
+
+    def _create_with_retry(self, **kwargs) -> Any:
+        """Create a chat completion, retrying transient errors with backoff."""
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return self.client.chat.completions.create(**kwargs)
+            except _RETRYABLE_ERRORS:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                time.sleep(_retry_delay(attempt))
+
+    async def _acreate_with_retry(self, **kwargs) -> Any:
+        """Async counterpart of `_create_with_retry`."""
+        for attempt in range(_MAX_ATTEMPTS):
+            try:
+                return await self.async_client.chat.completions.create(**kwargs)
+            except _RETRYABLE_ERRORS:
+                if attempt == _MAX_ATTEMPTS - 1:
+                    raise
+                await asyncio.sleep(_retry_delay(attempt))
+
     def chat_completion(
         self,
         messages: List[Dict[str, str]],
@@ -54,6 +172,8 @@ class AzureOpenAIClient:
         max_tokens: Optional[int] = None,
         tools: Optional[List[Dict[str, Any]]] = None,
         tool_choice: Optional[str] = None,
+        stream: bool = False,
+        request_timeout: Optional[float] = None,
     ) -> Dict[str, Any]:
         """Generate chat completion.
 
@@ -63,24 +183,213 @@ class AzureOpenAIClient:
             max_tokens: Override default max tokens
             tools: Optional list of tool definitions
             tool_choice: Tool choice strategy ('auto', 'none', or specific tool)
+            stream: If True, return an iterator of delta dicts as they arrive
+                (see `aggregate_stream` to rebuild a full response)
+            request_timeout: Override the per-request timeout in seconds
 
         Returns:
-            Response dictionary from Azure OpenAI
+            Response dictionary from Azure OpenAI, or an iterator of delta dicts when streaming
         """
-        kwargs = {
-            "model": self.deployment_name,
-            "messages": messages,
-            "temperature": temperature or self.temperature,
-            "max_tokens": max_tokens or self.max_tokens,
-        }
+        kwargs = self._build_request(messages, temperature, max_tokens, tools, tool_choice, stream, request_timeout)
+        response = self._create_with_retry(**kwargs)
 
-        if tools:
-            kwargs["tools"] = tools
-            kwargs["tool_choice"] = tool_choice or "auto"
+        if stream:
+            return self._iter_deltas(response)
+        return response
+
+    async def achat_completion(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+        tools: Optional[List[Dict[str, Any]]] = None,
+        tool_choice: Optional[str] = None,
+        stream: bool = False,
+        request_timeout: Optional[float] = None,
+    ) -> Dict[str, Any]:
+        """Generate chat completion asynchronously.
 
-        response = self.client.chat.completions.create(**kwargs)
+        Mirrors `chat_completion`; independent requests can be overlapped
+        with `asyncio.gather`.
+
+        Args:
+            messages: List of message dictionaries
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+            tools: Optional list of tool definitions
+            tool_choice: Tool choice strategy ('auto', 'none', or specific tool)
+            stream: If True, return an async iterator of delta dicts as they arrive
+            request_timeout: Override the per-request timeout in seconds
+
+        Returns:
+            Response dictionary from Azure OpenAI, or an async iterator of delta dicts when streaming
+        """
+        kwargs = self._build_request(messages, temperature, max_tokens, tools, tool_choice, stream, request_timeout)
+        response = await self._acreate_with_retry(**kwargs)
+
+        if stream:
+            return self._aiter_deltas(response)
         return response
 
+    def batch_completion(
+        self,
+        prompts: List[str],
+        system: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None,
+    ) -> List[str]:
+        """Answer several independent prompts in a single request.
+
+        Prompts are row-marshaled ("Row 1: ...") into one user message and
+        the model returns a JSON object with one answer per row, so the
+        round trip and shared prefill are paid once per batch.
+
+        Args:
+            prompts: Independent prompts (at most MAX_BATCH_SIZE)
+            system: Optional system instruction applied to every row
+            temperature: Override default temperature
+            max_tokens: Override default max tokens
+
+        Returns:
+            Answers in the same order as prompts
+        """
+        if len(prompts) > MAX_BATCH_SIZE:
+            raise ValueError(f"Batch size {len(prompts)} exceeds MAX_BATCH_SIZE ({MAX_BATCH_SIZE})")
+
+        rows = "\n".join(f"Row {i}: {prompt}" for i, prompt in enumerate(prompts, 1))
+        messages = [
+            {
+                "role": "system",
+                "content": (
+                    (system + "\n\n" if system else "")
+                    + "Answer each row independently. Respond with a JSON object "
+                    '{"answers": [...]} containing one string per row, in row order.'
+                )
+            },
+            {"role": "user", "content": rows}
+        ]
+
+        kwargs = self._build_request(messages, temperature, max_tokens, None, None, False)
+        kwargs["response_format"] = {"type": "json_object"}
+        response = self._create_with_retry(**kwargs)
+
+        payload = json.loads(self.extract_message_content(response))
+        answers = payload.get("answers") if isinstance(payload, dict) else None
+        if not isinstance(answers, list):
+            raise ValueError("Expected a JSON object with an 'answers' list")
+        if len(answers) != len(prompts):
+            raise ValueError(f"Expected {len(prompts)} answers, got {len(answers)}")
+
+        return [str(answer) for answer in answers]
+
+    @staticmethod
+    def _chunk_to_delta(chunk: Any) -> Optional[Dict[str, Any]]:
+        """Convert a streamed completion chunk into a delta dict."""
+        if not chunk.choices:
+            return None
+
+        choice = chunk.choices[0]
+        delta = choice.delta
+        tool_calls = []
+        for tool_call in getattr(delta, 'tool_calls', None) or ():
+            function = tool_call.function
+            tool_calls.append({
+                "index": tool_call.index,
+                "id": tool_call.id,
+                "type": tool_call.type,
+                "function": {
+                    "name": function.name if function else None,
+                    "arguments": function.arguments if function else None
+                }
+            })
+
+        return {
+            "content": delta.content,
+            "tool_calls": tool_calls,
+            "finish_reason": choice.finish_reason
+        }
+
+    @classmethod
+    def _iter_deltas(cls, chunks: Iterable[Any]) -> Iterator[Dict[str, Any]]:
+        """Convert streamed completion chunks into delta dicts.
+
+        Args:
+            chunks: Chunks from a streaming Azure OpenAI completion
+
+        Yields:
+            Dicts with 'content', 'tool_calls' and 'finish_reason' keys
+        """
+        for chunk in chunks:
+            delta = cls._chunk_to_delta(chunk)
+            if delta is not None:
+                yield delta
+
+    @classmethod
+    async def _aiter_deltas(cls, chunks: AsyncIterable[Any]) -> AsyncIterator[Dict[str, Any]]:
+        """Async counterpart of `_iter_deltas`."""
+        async for chunk in chunks:
+            delta = cls._chunk_to_delta(chunk)
+            if delta is not None:
+                yield delta
+
+    @staticmethod
+    def aggregate_stream(deltas: Iterable[Dict[str, Any]]) -> Any:
+        """Rebuild a full response from streamed delta dicts.
+
+        Content fragments are concatenated and tool call argument fragments
+        are joined by tool call index, so the result works with
+        `extract_message_content` and `extract_tool_calls`.
+
+        Args:
+            deltas: Delta dicts returned by `chat_completion(..., stream=True)`
+                (collect async streams into a list first)
+
+        Returns:
+            Response-like object with `choices[0].message` and `choices[0].finish_reason`
+        """
+        content_parts = []
+        tool_calls: Dict[int, Dict[str, Any]] = {}
+        finish_reason = None
+
+        for delta in deltas:
+            if delta["content"]:
+                content_parts.append(delta["content"])
+
+            for fragment in delta["tool_calls"]:
+                entry = tool_calls.setdefault(fragment["index"], {
+                    "id": None, "type": "function", "name": "", "arguments": []
+                })
+                if fragment["id"]:
+                    entry["id"] = fragment["id"]
+                if fragment["type"]:
+                    entry["type"] = fragment["type"]
+                if fragment["function"]["name"]:
+                    entry["name"] += fragment["function"]["name"]
+                if fragment["function"]["arguments"]:
+                    entry["arguments"].append(fragment["function"]["arguments"])
+
+            if delta["finish_reason"]:
+                finish_reason = delta["finish_reason"]
+
+        message = SimpleNamespace(
+            role="assistant",
+            content="".join(content_parts) or None,
+            tool_calls=[
+                SimpleNamespace(
+                    id=entry["id"],
+                    type=entry["type"],
+                    function=SimpleNamespace(
+                        name=entry["name"],
+                        arguments="".join(entry["arguments"])
+                    )
+                )
+                for _, entry in sorted(tool_calls.items())
+            ] or None
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message, finish_reason=finish_reason)]
+        )
+
     def extract_message_content(self, response: Any) -> str:
         """Extract text content from response.
 
@@ -92,6 +401,22 @@ class AzureOpenAIClient:
         """
         return response.choices[0].message.content or ""
 
+    def extract_cached_tokens(self, response: Any) -> int:
+        """Extract how many prompt tokens were served from the prompt cache.
+
+        Azure OpenAI caches prompt prefixes automatically (1024+ tokens), so
+        keep static instructions and tool definitions ahead of dynamic content.
+
+        Args:
+            response: Azure OpenAI response
+
+        Returns:
+            Cached prompt token count (0 when not reported)
+        """
+        usage = getattr(response, 'usage', None)
+        details = getattr(usage, 'prompt_tokens_details', None)
+        return getattr(details, 'cached_tokens', None) or 0
+
     def extract_tool_calls(self, response: Any) -> List[Dict[str, Any]]:
         """Extract tool calls from response.
 
@@ -101,18 +426,33 @@ class AzureOpenAIClient:
         Returns:
             List of tool call dictionaries
         """
-        message = response.choices[0].message
-        if not hasattr(message, 'tool_calls') or not message.tool_calls:
-            return []
-
-        tool_calls = []
-        for tool_call in message.tool_calls:
-            tool_calls.append({
+        tool_calls = getattr(response.choices[0].message, 'tool_calls', None) or ()
+        return [
+            {
                 "id": tool_call.id,
                 "type": tool_call.type,
                 "function": {
                     "name": tool_call.function.name,
                     "arguments": tool_call.function.arguments
                 }
-            })
-        return tool_calls
+            }
+            for tool_call in tool_calls
+        ]
+
+    def extract_tool_calls_flat(self, response: Any) -> List[Tuple[str, str, str]]:
+        """Extract tool calls from response as flat tuples.
+
+        Cheaper than `extract_tool_calls` for dispatch code that only needs
+        to unpack each call.
+
+        Args:
+            response: Azure OpenAI response
+
+        Returns:
+            List of (id, function name, arguments JSON string) tuples
+        """
+        tool_calls = getattr(response.choices[0].message, 'tool_calls', None) or ()
+        return [
+            (tool_call.id, tool_call.function.name, tool_call.function.arguments)
+            for tool_call in tool_calls
+        ]
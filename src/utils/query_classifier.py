@@ -8,6 +8,34 @@ This is a framework component - users can customize classification logic for the
 from enum import Enum
 from typing import Dict, Any, Optional
 import json
+import re
+
+
+# Fast-path patterns for queries that are obvious enough to skip the LLM round-trip
+# Whole-query match: greeting words plus punctuation only, so "hi, create files" still reaches the LLM
+_GREET_ONLY_RE = re.compile(r'^[\W_]*(?:(?:hello|hi|hey|hola|bonjour|[你您]好|嗨)[\W_]*)+$', re.I)
+_SHORT_Q_RE = re.compile(r'^(what|who|when|where) is\s', re.I)
+_ZH_GREET_RE = re.compile(r'[你您]好|嗨')
+
+_ZH_GREETING = """你好！我是一个智能 AI Agent，可以帮助您处理各种任务。
+
+我的能力包括：
+• 💡 规划和执行复杂任务
+• 📝 编写和分析代码
+• 🔍 研究和收集信息
+• 🤔 问题解决和决策
+
+有什么我可以帮助您的吗？"""
+
+_EN_GREETING = """Hello! I'm an intelligent AI Agent that can help you with various tasks.
+
+My capabilities include:
+• 💡 Planning and executing complex tasks
+• 📝 Writing and analyzing code
+• 🔍 Researching and gathering information
+• 🤔 Problem-solving and decision making
+
+What can I help you with today?"""
 
 
 class QueryType(Enum):
@@ -18,6 +46,10 @@ class QueryType(Enum):
     CLARIFICATION = "clarification"
 
 
+# Name -> member lookup, cheaper than QueryType[...] with try/except
+_QT_LOOKUP = {name: member for name, member in QueryType.__members__.items()}
+
+
 class QueryClassifier:
     """
     LLM-based query classifier for intelligent routing.
@@ -29,6 +61,7 @@ class QueryClassifier:
     - Override classification logic
     """
 
+    # The query goes last so the static instructions form a cacheable prompt prefix
     DEFAULT_CLASSIFICATION_PROMPT = """You are a query classifier for an AI agent system. Analyze the user's query and classify it into one of these categories:
 
 1. GREETING - Simple greetings, small talk (e.g., "hello", "how are you", "你好")
@@ -43,15 +76,22 @@ class QueryClassifier:
 4. CLARIFICATION - User clarifying or confirming something
    → Strategy: Context-aware response
 
-User Query: "{query}"
-
 Respond ONLY with a JSON object in this exact format:
 {{
     "type": "GREETING|SIMPLE_QUESTION|COMPLEX_TASK|CLARIFICATION",
     "confidence": 0.0-1.0,
     "reasoning": "brief explanation",
     "use_full_workflow": true|false
-}}"""
+}}
+
+User Query: "{query}\""""
+
+    _STRATEGY_MAP = {
+        QueryType.GREETING: "direct_response",
+        QueryType.SIMPLE_QUESTION: "quick_answer",
+        QueryType.COMPLEX_TASK: "full_planning",
+        QueryType.CLARIFICATION: "context_aware"
+    }
 
     def __init__(self, llm_client=None, custom_prompt: Optional[str] = None):
         """
@@ -63,6 +103,8 @@ Respond ONLY with a JSON object in this exact format:
         """
         self.llm_client = llm_client
         self.classification_prompt = custom_prompt or self.DEFAULT_CLASSIFICATION_PROMPT
+        # Fast-path types follow the default categories; custom prompts define their own
+        self.use_fast_path = custom_prompt is None
 
     def classify(self, query: str) -> Dict[str, Any]:
         """
@@ -80,7 +122,14 @@ Respond ONLY with a JSON object in this exact format:
                 "reasoning": str,
                 "suggested_response_strategy": str
             }
+            Results produced after a failed LLM call also carry "fallback": True.
         """
+        # Fast path: obvious cases don't need an LLM call
+        if self.use_fast_path:
+            fast_result = self._fast_path_classification(query)
+            if fast_result is not None:
+                return fast_result
+
         if self.llm_client is None:
             # Fallback: assume complex task if no LLM client
             return self._fallback_classification(query)
@@ -96,7 +145,7 @@ Respond ONLY with a JSON object in this exact format:
             )
 
             # Parse LLM response
-            result_text = response.get('content', '').strip()
+            result_text = self.llm_client.extract_message_content(response).strip()
 
             # Extract JSON from response
             if '```json' in result_text:
@@ -108,10 +157,7 @@ Respond ONLY with a JSON object in this exact format:
 
             # Convert to QueryType enum
             query_type_str = classification.get('type', 'COMPLEX_TASK').upper()
-            try:
-                query_type = QueryType[query_type_str]
-            except KeyError:
-                query_type = QueryType.COMPLEX_TASK
+            query_type = _QT_LOOKUP.get(query_type_str, QueryType.COMPLEX_TASK)
 
             return {
                 "type": query_type,
@@ -124,7 +170,41 @@ Respond ONLY with a JSON object in this exact format:
         except Exception as e:
             # Fallback on error
             print(f"Classification error: {e}, using fallback")
-            return self._fallback_classification(query)
+            result = self._fallback_classification(query)
+            result["fallback"] = True
+            return result
+
+    def _fast_path_classification(self, query: str) -> Optional[Dict[str, Any]]:
+        """
+        Classify trivial queries (short greetings, short factoid questions) without the LLM.
+
+        Args:
+            query: User query
+
+        Returns:
+            Classification result, or None if the query is ambiguous
+        """
+        query = query.strip()
+
+        if _GREET_ONLY_RE.match(query):
+            return {
+                "type": QueryType.GREETING,
+                "confidence": 0.9,
+                "use_full_workflow": False,
+                "reasoning": "Simple greeting detected",
+                "suggested_response_strategy": self._get_strategy(QueryType.GREETING)
+            }
+
+        if _SHORT_Q_RE.match(query) and len(query) < 80:
+            return {
+                "type": QueryType.SIMPLE_QUESTION,
+                "confidence": 0.8,
+                "use_full_workflow": False,
+                "reasoning": "Short factual question detected",
+                "suggested_response_strategy": self._get_strategy(QueryType.SIMPLE_QUESTION)
+            }
+
+        return None
 
     def _fallback_classification(self, query: str) -> Dict[str, Any]:
         """
@@ -161,13 +241,7 @@ Respond ONLY with a JSON object in this exact format:
 
     def _get_strategy(self, query_type: QueryType) -> str:
         """Get response strategy for query type."""
-        strategy_map = {
-            QueryType.GREETING: "direct_response",
-            QueryType.SIMPLE_QUESTION: "quick_answer",
-            QueryType.COMPLEX_TASK: "full_planning",
-            QueryType.CLARIFICATION: "context_aware"
-        }
-        return strategy_map.get(query_type, "full_planning")
+        return self._STRATEGY_MAP.get(query_type, "full_planning")
 
     def get_quick_response(self, query: str, classification: Dict[str, Any]) -> str:
         """
@@ -187,29 +261,8 @@ Respond ONLY with a JSON object in this exact format:
 
     def _get_greeting_response(self, query: str) -> str:
         """Generate greeting response."""
-        query_lower = query.lower()
-
         # Check language and respond appropriately
-        if any(ch in query for ch in ['你好', '您好', '嗨']):
-            return """你好！我是一个智能 AI Agent，可以帮助您处理各种任务。
-
-我的能力包括：
-• 💡 规划和执行复杂任务
-• 📝 编写和分析代码
-• 🔍 研究和收集信息
-• 🤔 问题解决和决策
-
-有什么我可以帮助您的吗？"""
-        else:
-            return """Hello! I'm an intelligent AI Agent that can help you with various tasks.
-
-My capabilities include:
-• 💡 Planning and executing complex tasks
-• 📝 Writing and analyzing code
-• 🔍 Researching and gathering information
-• 🤔 Problem-solving and decision making
-
-What can I help you with today?"""
+        return _ZH_GREETING if _ZH_GREET_RE.search(query) else _EN_GREETING
 
 
 # Convenience function
@@ -1,12 +1,22 @@
 """FastAPI web application for Agent Dashboard."""
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, Request
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import HTMLResponse, StreamingResponse
-from pydantic import BaseModel
-from typing import List, Dict, Any, Optional
-import json
+from fastapi.responses import HTMLResponse, StreamingResponse, Response, FileResponse
+from starlette.concurrency import run_in_threadpool
+from starlette.datastructures import Headers
+from pydantic import BaseModel, ValidationError
+from typing import Deque, Dict, Any, List, Optional, Set, Tuple, Union
+import orjson
 import asyncio
+import functools
+import gzip
+import hashlib
+import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -16,13 +26,97 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 from src.agent import GeneralPurposeAgent
 from src.streaming import StreamHandler, StreamEvent, StreamEventType
 from src.collaboration import AgentOrchestrator
+from src.utils.query_classifier import QueryClassifier
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Build shared LLM client, agent scaffolding and worker pool once at startup."""
+    init_shared_state(app.state)
+    app.state.pages = render_static_pages()
+
+    # Bounded pool for blocking agent runs, shared by all requests
+    app.state.agent_executor = ThreadPoolExecutor(
+        max_workers=int(os.getenv('AGENT_WORKERS', 8)),
+        thread_name_prefix="agent"
+    )
+    try:
+        yield
+    finally:
+        app.state.agent_executor.shutdown(wait=False)
+
+
+app = FastAPI(
+    title="Agent Dashboard",
+    version="1.0.0",
+    lifespan=lifespan
+)
+
+
+
+class CachedStaticFiles(StaticFiles):
+    """
+    StaticFiles with long-lived browser caching and gzip-compressed assets.
+
+    Asset URLs carry a content hash (see `render_static_pages`), so responses
+    can be marked immutable. Compressed bodies are cached in memory and
+    rebuilt only when the file changes. In production, serving /static from
+    nginx with `gzip_static on` is still cheaper.
+    """
+
+    CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._gzip_cache: Dict[str, Tuple[float, bytes]] = {}
+
+    def _gzipped(self, path: str, mtime: float) -> bytes:
+        cached = self._gzip_cache.get(path)
+        if cached is None or cached[0] != mtime:
+            with open(path, 'rb') as f:
+                cached = (mtime, gzip.compress(f.read(), compresslevel=9, mtime=0))
+            self._gzip_cache[path] = cached
+        return cached[1]
+
+    async def get_response(self, path: str, scope) -> Response:
+        response = await super().get_response(path, scope)
+        if not isinstance(response, FileResponse):
+            return response
+
+        response.headers["Cache-Control"] = self.CACHE_CONTROL
+
+        request_headers = Headers(scope=scope)
+        if (
+            scope["method"] != "GET"
+            or "range" in request_headers
+            or "gzip" not in request_headers.get("accept-encoding", "")
+        ):
+            return response
+
+        body = await run_in_threadpool(self._gzipped, response.path, response.stat_result.st_mtime)
+        return Response(
+            content=body,
+            media_type=response.media_type,
+            headers={
+                "Cache-Control": self.CACHE_CONTROL,
+                "Content-Encoding": "gzip",
+                "Vary": "Accept-Encoding",
+                "Last-Modified": response.headers["last-modified"],
+            }
+        )
 
-app = FastAPI(title="Agent Dashboard", version="1.0.0")
 
 # Setup templates and static files
 BASE_DIR = Path(__file__).resolve().parent
 templates = Jinja2Templates(directory=str(BASE_DIR / "templates"))
-app.mount("/static", StaticFiles(directory=str(BASE_DIR / "static")), name="static")
+app.mount("/static", CachedStaticFiles(directory=str(BASE_DIR / "static")), name="static")
+
+# SSE responses must not be cached or buffered by reverse proxies (e.g. nginx)
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+# Keep-alive comment sent while waiting on long agent runs
+SSE_PING_INTERVAL = 15.0
+SSE_PING = b": ping\n\n"
 
 
 class TaskRequest(BaseModel):
@@ -32,30 +126,164 @@ class TaskRequest(BaseModel):
     use_collaboration: bool = False
 
 
+class EvaluationSummary(BaseModel):
+    """Evaluation details returned to clients."""
+    overall_success: bool
+    overall_score: float
+    strengths: List[str] = []
+    weaknesses: List[str] = []
+    lessons_learned: Optional[List[str]] = None
+
+
+class TaskResponse(BaseModel):
+    """Response model for /api/run."""
+    success: bool
+    score: Optional[float] = None
+    summary: Optional[str] = None
+    evaluation: Optional[EvaluationSummary] = None
+    demo_mode: Optional[bool] = None
+    error: Optional[str] = None
+    traceback: Optional[str] = None
+
+
+class CollaborationResponse(BaseModel):
+    """Response model for /api/collaboration/run."""
+    success: bool
+    result: Optional[Dict[str, Any]] = None
+    demo_mode: Optional[bool] = None
+    error: Optional[str] = None
+    traceback: Optional[str] = None
+
+
+class HealthResponse(BaseModel):
+    """Response model for /health."""
+    status: str
+    version: str
+    configured: bool
+    environment: Dict[str, bool]
+
+
+class ConfigRefreshResponse(BaseModel):
+    """Response model for /api/config/refresh."""
+    configured: bool
+    environment: Dict[str, bool]
+
+
+class WSCommand(BaseModel):
+    """Command sent by websocket clients."""
+    type: str
+    goal: Optional[str] = None
+
+
 class ConnectionManager:
     """Manage WebSocket connections."""
 
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        self.active_connections.remove(websocket)
+        self.active_connections.discard(websocket)
+
+    async def broadcast(self, message: Union[str, bytes, Dict[str, Any]]):
+        """Send a message to all clients concurrently, dropping dead connections.
+
+        Dicts are serialized to JSON once (via orjson, never Starlette's
+        send_json per connection) and the same text is sent to every client
+        as a text frame; the server still UTF-8 encodes each send.
+        """
+        if isinstance(message, dict):
+            payload = orjson.dumps(message).decode("utf-8")
+        elif isinstance(message, bytes):
+            payload = message.decode("utf-8")
+        else:
+            payload = message
+        connections = list(self.active_connections)
+        results = await asyncio.gather(
+            *(connection.send_text(payload) for connection in connections),
+            return_exceptions=True
+        )
 
-    async def broadcast(self, message: str):
-        for connection in self.active_connections:
-            try:
-                await connection.send_text(message)
-            except:
-                pass
+        for connection, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.disconnect(connection)
 
 
 manager = ConnectionManager()
 
 
+class OutboundQueue:
+    """
+    Per-connection outbound buffer drained by a dedicated writer task.
+
+    Handlers enqueue messages without awaiting the socket, so a slow client
+    never stalls the handler. When the buffer is full, the oldest progress
+    event is dropped; start/complete/error messages are always kept.
+    """
+
+    def __init__(self, websocket: WebSocket, maxsize: int = 256):
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self._pending: Deque[Tuple[Optional[str], str]] = deque()
+        self._ready = asyncio.Event()
+        self._writer = asyncio.create_task(self._writer_loop())
+
+    async def _writer_loop(self):
+        while True:
+            while not self._pending:
+                self._ready.clear()
+                await self._ready.wait()
+
+            _, payload = self._pending.popleft()
+            await self.websocket.send_text(payload)
+
+    def send(self, message: Dict[str, Any]):
+        """Queue a JSON message for the writer task."""
+        message_type = message.get('type')
+
+        if len(self._pending) >= self.maxsize:
+            for index, (pending_type, _) in enumerate(self._pending):
+                if pending_type == 'progress':
+                    del self._pending[index]
+                    break
+            else:
+                if message_type == 'progress':
+                    return
+
+        # Text frames: browsers hand binary frames to onmessage as a Blob
+        self._pending.append((message_type, orjson.dumps(message).decode("utf-8")))
+        self._ready.set()
+
+    async def close(self):
+        """Stop the writer task, discarding anything still queued."""
+        self._writer.cancel()
+        try:
+            await self._writer
+        except (asyncio.CancelledError, Exception):
+            pass
+
+
+@functools.lru_cache(maxsize=1)
+def get_azure_openai_env() -> Dict[str, bool]:
+    """
+    Snapshot which Azure OpenAI environment variables are set.
+
+    Cached so hot paths don't re-read the environment; call
+    `get_azure_openai_env.cache_clear()` (or POST /api/config/refresh) to re-read.
+
+    Returns:
+        Dict mapping has_api_key, has_endpoint and has_deployment to bools.
+    """
+    return {
+        "has_api_key": bool(os.getenv('AZURE_OPENAI_API_KEY')),
+        "has_endpoint": bool(os.getenv('AZURE_OPENAI_ENDPOINT')),
+        "has_deployment": bool(os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'))
+    }
+
+
 def is_azure_openai_configured() -> bool:
     """
     Check if Azure OpenAI is properly configured.
@@ -63,59 +291,219 @@ def is_azure_openai_configured() -> bool:
     Returns:
         bool: True if all required environment variables are set, False otherwise.
     """
-    import os
-    
-    has_api_key = bool(os.getenv('AZURE_OPENAI_API_KEY'))
-    has_endpoint = bool(os.getenv('AZURE_OPENAI_ENDPOINT'))
-    has_deployment = bool(os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'))
-    
-    return has_api_key and has_endpoint and has_deployment
+    return all(get_azure_openai_env().values())
+
+
+def render_static_pages() -> Dict[str, bytes]:
+    """
+    Pre-render the HTML pages once.
+
+    The templates don't depend on the request, so each is rendered a
+    single time and served as bytes. Asset URLs get a `?v=` content hash.
+
+    Returns:
+        Dict mapping template name to rendered HTML bytes
+    """
+    # Content hash appended to asset URLs so immutable caching never serves stale files
+    digest = hashlib.sha1()
+    for asset in sorted((BASE_DIR / "static").iterdir()):
+        if asset.is_file():
+            digest.update(asset.read_bytes())
+    context = {"request": None, "static_version": digest.hexdigest()[:12]}
+
+    return {
+        name: templates.get_template(name).render(context).encode("utf-8")
+        for name in ("chat.html", "index.html")
+    }
+
+
+def model_response(model: BaseModel) -> Response:
+    """
+    Serialize a response model with Pydantic's Rust serializer.
+
+    Returning a Response directly skips FastAPI's jsonable_encoder and
+    response validation passes. Top-level None fields are omitted; nested
+    payloads (e.g. plans inside a collaboration result) keep their nulls.
+
+    Args:
+        model: Response model instance
+
+    Returns:
+        Response with application/json body
+    """
+    unset = {name for name, value in model if value is None}
+    return Response(
+        content=model.model_dump_json(exclude=unset).encode(),
+        media_type="application/json"
+    )
+
+
+def init_shared_state(state):
+    """
+    Create the LLM client and collaboration agents shared by all requests.
+
+    Agents that keep per-run state (GeneralPurposeAgent, AgentOrchestrator) are
+    still created per request, but reuse these objects instead of rebuilding them.
+
+    Args:
+        state: Application state to populate
+    """
+    state.llm_client = None
+    state.collaboration_agents = {}
+    set_classifier(state)
+
+    if not is_azure_openai_configured():
+        return
+
+    from src.utils.llm_client import AzureOpenAIClient
+    from src.planning import PlanningModule
+    from src.execution import ExecutionEngine
+    from src.evaluation import EvaluationModule
+    from src.tools.base import ToolRegistry
+    from src.tools import FileReadTool, FileWriteTool
+    from src.collaboration import PlannerAgent, ExecutorAgent, ReviewerAgent, AgentRole
+
+    try:
+        llm_client = AzureOpenAIClient()
+    except Exception as e:
+        print(f"Failed to initialize shared LLM client: {e}")
+        return
+
+    tool_registry = ToolRegistry()
+    tool_registry.register(FileReadTool())
+    tool_registry.register(FileWriteTool())
+
+    state.llm_client = llm_client
+    set_classifier(state)
+    state.collaboration_agents = {
+        'planner': (PlannerAgent(PlanningModule(llm_client)), AgentRole.PLANNER),
+        'executor': (ExecutorAgent(ExecutionEngine(llm_client, tool_registry)), AgentRole.EXECUTOR),
+        'reviewer': (ReviewerAgent(EvaluationModule(llm_client)), AgentRole.REVIEWER),
+    }
+
+
+CLASSIFICATION_CACHE_SIZE = 1024
+
+
+def set_classifier(state):
+    """
+    Attach a query classifier and its result cache to the app state.
+
+    Args:
+        state: Application state holding the shared LLM client
+    """
+    state.classifier = QueryClassifier(llm_client=state.llm_client)
+    state.classification_cache = OrderedDict()
+    state.classification_lock = threading.Lock()
+
+
+def classify_cached(state, goal: str) -> Dict[str, Any]:
+    """
+    Classify a normalized goal, reusing earlier results (LRU).
+
+    Identical goals (demos, retries) skip another LLM round-trip. Fallback
+    results from a failed LLM call are not cached, so the next request retries.
+
+    Args:
+        state: Application state holding the classifier
+        goal: Normalized goal
+
+    Returns:
+        Classification result
+    """
+    cache = state.classification_cache
+    with state.classification_lock:
+        if goal in cache:
+            cache.move_to_end(goal)
+            return cache[goal]
+
+    classification = state.classifier.classify(goal)
+    if not classification.get("fallback"):
+        with state.classification_lock:
+            cache[goal] = classification
+            if len(cache) > CLASSIFICATION_CACHE_SIZE:
+                cache.popitem(last=False)
+    return classification
+
+
+def run_in_agent_pool(state, func, *args) -> asyncio.Future:
+    """
+    Run a blocking call (e.g. agent.run) on the shared agent pool.
+
+    Args:
+        state: Application state holding the executor
+        func: Blocking callable
+        *args: Positional arguments for func
+
+    Returns:
+        Awaitable future with the call's result
+    """
+    loop = asyncio.get_running_loop()
+    return loop.run_in_executor(state.agent_executor, functools.partial(func, *args))
+
+
+def create_agent(state, config: Optional[Dict[str, Any]] = None) -> GeneralPurposeAgent:
+    """
+    Create a per-request agent that reuses the shared LLM client.
+
+    Args:
+        state: Application state holding shared objects
+        config: Optional partial config merged over the agent defaults
+
+    Returns:
+        GeneralPurposeAgent instance
+    """
+    agent_config = GeneralPurposeAgent.default_config(verbose=False, overrides=config) if config else None
+
+    # LLM overrides need their own client settings, so don't share in that case
+    llm_client = None if config and 'llm' in config else state.llm_client
+
+    return GeneralPurposeAgent(config=agent_config, verbose=False, llm_client=llm_client)
 
 
 @app.get("/", response_class=HTMLResponse)
 async def home(request: Request):
     """Render chat page (default)."""
-    return templates.TemplateResponse("chat.html", {"request": request})
+    return HTMLResponse(content=request.app.state.pages["chat.html"])
 
 
 @app.get("/dashboard", response_class=HTMLResponse)
 async def dashboard(request: Request):
     """Render dashboard page."""
-    return templates.TemplateResponse("index.html", {"request": request})
+    return HTMLResponse(content=request.app.state.pages["index.html"])
 
 
 @app.get("/chat", response_class=HTMLResponse)
 async def chat(request: Request):
     """Render chat page."""
-    return templates.TemplateResponse("chat.html", {"request": request})
+    return HTMLResponse(content=request.app.state.pages["chat.html"])
 
 
 @app.get("/health")
 async def health_check():
     """Health check endpoint."""
-    import os
+    return model_response(HealthResponse(
+        status="healthy",
+        version="1.0.0",
+        configured=is_azure_openai_configured(),
+        environment=get_azure_openai_env()
+    ))
 
-    # Check if environment variables are set
-    has_api_key = bool(os.getenv('AZURE_OPENAI_API_KEY'))
-    has_endpoint = bool(os.getenv('AZURE_OPENAI_ENDPOINT'))
-    has_deployment = bool(os.getenv('AZURE_OPENAI_DEPLOYMENT_NAME'))
 
-    is_configured = is_azure_openai_configured()
+@app.post("/api/config/refresh")
+async def refresh_config(request: Request):
+    """Re-read Azure OpenAI environment variables and rebuild shared clients."""
+    get_azure_openai_env.cache_clear()
+    init_shared_state(request.app.state)
 
-    return {
-        "status": "healthy",
-        "version": "1.0.0",
-        "configured": is_configured,
-        "environment": {
-            "has_api_key": has_api_key,
-            "has_endpoint": has_endpoint,
-            "has_deployment": has_deployment
-        }
-    }
+    return model_response(ConfigRefreshResponse(
+        configured=is_azure_openai_configured(),
+        environment=get_azure_openai_env()
+    ))
 
 
 @app.post("/api/run")
-async def run_task(task: TaskRequest):
+async def run_task(task: TaskRequest, request: Request):
     """Run a task with the agent."""
     try:
         # Check if configured
@@ -123,124 +511,105 @@ async def run_task(task: TaskRequest):
 
         if not is_configured:
             # Return demo response
-            return {
-                "success": True,
-                "score": 0.85,
-                "summary": "Demo mode: Azure OpenAI not configured. This is a simulated response.",
-                "evaluation": {
-                    "overall_success": True,
-                    "overall_score": 0.85,
-                    "strengths": [
+            return model_response(TaskResponse(
+                success=True,
+                score=0.85,
+                summary="Demo mode: Azure OpenAI not configured. This is a simulated response.",
+                evaluation=EvaluationSummary(
+                    overall_success=True,
+                    overall_score=0.85,
+                    strengths=[
                         "Demo mode is working correctly",
                         "UI is responsive and functional"
                     ],
-                    "weaknesses": [
+                    weaknesses=[
                         "Azure OpenAI credentials not configured",
                         "Cannot execute real tasks"
                     ],
-                    "lessons_learned": [
+                    lessons_learned=[
                         "Configure .env file with Azure OpenAI credentials to enable real functionality"
                     ]
-                },
-                "demo_mode": True
-            }
+                ),
+                demo_mode=True
+            ))
 
         # Real execution
-        agent = GeneralPurposeAgent(
-            config=task.config,
-            verbose=False
-        )
-
-        evaluation = agent.run(task.goal)
-
-        return {
-            "success": evaluation.overall_success,
-            "score": evaluation.overall_score,
-            "summary": evaluation.summary,
-            "evaluation": {
-                "overall_success": evaluation.overall_success,
-                "overall_score": evaluation.overall_score,
-                "strengths": evaluation.strengths,
-                "weaknesses": evaluation.weaknesses,
-                "lessons_learned": evaluation.lessons_learned
-            },
-            "demo_mode": False
-        }
+        agent = create_agent(request.app.state, task.config)
+
+        evaluation = await run_in_agent_pool(request.app.state, agent.run, task.goal)
+
+        return model_response(TaskResponse(
+            success=evaluation.overall_success,
+            score=evaluation.overall_score,
+            summary=evaluation.summary,
+            evaluation=EvaluationSummary(
+                overall_success=evaluation.overall_success,
+                overall_score=evaluation.overall_score,
+                strengths=evaluation.strengths,
+                weaknesses=evaluation.weaknesses,
+                lessons_learned=evaluation.lessons_learned
+            ),
+            demo_mode=False
+        ))
     except Exception as e:
         import traceback
-        return {
-            "success": False,
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }
+        return model_response(TaskResponse(
+            success=False,
+            error=str(e),
+            traceback=traceback.format_exc()
+        ))
 
 
 @app.get("/api/stream/{goal}")
-async def stream_task(goal: str):
+async def stream_task(goal: str, request: Request):
     """Stream task execution with Server-Sent Events."""
     async def event_generator():
         try:
-            from src.utils.query_classifier import QueryClassifier
-
-            stream_handler = StreamHandler()
-            is_configured = is_azure_openai_configured()
-
             # Emit start
-            stream_handler.emit_start(goal)
-            for event in stream_handler.get_history():
-                yield event.to_sse()
-                await asyncio.sleep(0.1)
+            yield StreamEvent(type=StreamEventType.START, data={'goal': goal}).to_sse_bytes()
 
             # Classify query to determine response strategy using LLM
-            from src.utils.llm_client import AzureOpenAIClient
-
-            llm_client = None
-            if is_configured:
-                try:
-                    llm_client = AzureOpenAIClient()
-                except Exception as e:
-                    print(f"Failed to initialize LLM client for classification: {e}")
-
-            classifier = QueryClassifier(llm_client=llm_client)
-            classification = classifier.classify(goal)
+            state = request.app.state
+            classifier = state.classifier
+            # Classification is short; keep it off the agent pool so it never queues behind agent runs
+            classification = await asyncio.to_thread(classify_cached, state, goal.strip().lower())
 
             # Handle simple queries with quick responses
             if not classification["use_full_workflow"]:
                 quick_response = classifier.get_quick_response(goal, classification)
 
                 if quick_response:
-                    # Direct response without full workflow
-                    stream_handler.emit_complete({
+                    # Direct response without full workflow - the complete event
+                    # is the only frame, so encode it without a StreamHandler
+                    yield StreamEvent(type=StreamEventType.COMPLETE, data={'result': {
                         "success": True,
                         "score": 1.0,
                         "summary": quick_response,
                         "quick_response": True,
                         "query_type": classification["type"].value
-                    })
-                    yield stream_handler.get_history()[-1].to_sse()
+                    }}).to_sse_bytes()
                     return
 
+            stream_handler = StreamHandler()
+            is_configured = is_azure_openai_configured()
+
+            # Collect events and flush them in batches at logical boundaries,
+            # so adjacent events share one network write
+            pending: List[StreamEvent] = []
+            stream_handler.subscribe(pending.append)
+
+            def flush() -> bytes:
+                frame = b"".join(event.to_sse_bytes() for event in pending)
+                pending.clear()
+                return frame
+
             if not is_configured:
                 # Demo mode
                 stream_handler.emit_planning("Demo mode: Planning task...")
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.5)
-
                 stream_handler.emit_progress("Demo mode: Simulating execution...", 30)
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.5)
-
                 stream_handler.emit_execution("Demo mode: Processing...", 50)
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.5)
-
                 stream_handler.emit_progress("Demo mode: Almost done...", 70)
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.5)
-
                 stream_handler.emit_evaluation({"score": 0.85, "success": True})
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.5)
 
                 stream_handler.emit_complete({
                     "success": True,
@@ -248,54 +617,41 @@ async def stream_task(goal: str):
                     "summary": "Demo mode: Azure OpenAI not configured. Configure .env to enable real functionality.",
                     "demo_mode": True
                 })
-                yield stream_handler.get_history()[-1].to_sse()
+                yield flush()
             else:
                 # Real execution - run in executor to avoid blocking
-                import concurrent.futures
-
                 stream_handler.emit_planning("Creating execution plan...")
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.3)
-
                 stream_handler.emit_progress("Initializing agent...", 10)
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.3)
-
                 stream_handler.emit_thinking("Analyzing task requirements...")
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.3)
-
                 stream_handler.emit_progress("Planning approach...", 30)
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.3)
 
                 # Run agent in executor to avoid blocking the event loop
                 def run_agent():
-                    agent = GeneralPurposeAgent(verbose=False)
+                    agent = create_agent(request.app.state)
                     return agent.run(goal)
 
                 stream_handler.emit_execution("Executing task...", 60)
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.3)
-
                 stream_handler.emit_progress("Running agent...", 50)
-                yield stream_handler.get_history()[-1].to_sse()
+
+                yield flush()
 
                 # Execute in thread pool
-                loop = asyncio.get_event_loop()
-                with concurrent.futures.ThreadPoolExecutor() as executor:
-                    evaluation = await loop.run_in_executor(executor, run_agent)
+                agent_future = run_in_agent_pool(request.app.state, run_agent)
 
-                stream_handler.emit_progress("Task completed, evaluating...", 80)
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.3)
+                # Keep the connection alive through proxies while the agent runs
+                while True:
+                    done, _ = await asyncio.wait({agent_future}, timeout=SSE_PING_INTERVAL)
+                    if done:
+                        break
+                    yield SSE_PING
 
+                evaluation = agent_future.result()
+
+                stream_handler.emit_progress("Task completed, evaluating...", 80)
                 stream_handler.emit_evaluation({
                     "score": evaluation.overall_score,
                     "success": evaluation.overall_success
                 })
-                yield stream_handler.get_history()[-1].to_sse()
-                await asyncio.sleep(0.3)
 
                 # Build comprehensive response
                 response_summary = evaluation.summary
@@ -315,18 +671,19 @@ async def stream_task(goal: str):
                     "score": evaluation.overall_score,
                     "summary": response_summary
                 })
-                yield stream_handler.get_history()[-1].to_sse()
+                yield flush()
 
         except Exception as e:
             error_event = StreamEvent(
                 type=StreamEventType.ERROR,
                 data={'error': str(e)}
             )
-            yield error_event.to_sse()
+            yield error_event.to_sse_bytes()
 
     return StreamingResponse(
         event_generator(),
-        media_type="text/event-stream"
+        media_type="text/event-stream",
+        headers=SSE_HEADERS
     )
 
 
@@ -334,18 +691,29 @@ async def stream_task(goal: str):
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time communication."""
     await manager.connect(websocket)
+    outbound = OutboundQueue(websocket)
 
     try:
         while True:
-            # Receive message from client
-            data = await websocket.receive_text()
-            message = json.loads(data)
+            # Receive message from client (text or binary frame)
+            frame = await websocket.receive()
+            if frame["type"] == "websocket.disconnect":
+                raise WebSocketDisconnect(frame.get("code", 1000))
 
-            if message.get('type') == 'run_task':
-                goal = message.get('goal')
+            try:
+                command = WSCommand.model_validate_json(frame.get("bytes") or frame.get("text") or "")
+            except ValidationError as e:
+                outbound.send({
+                    'type': 'error',
+                    'data': {'error': f"Invalid message: {e.errors()[0]['msg']}"}
+                })
+                continue
+
+            if command.type == 'run_task':
+                goal = command.goal
 
                 # Send start event
-                await websocket.send_json({
+                outbound.send({
                     'type': 'start',
                     'data': {'goal': goal}
                 })
@@ -356,21 +724,21 @@ async def websocket_endpoint(websocket: WebSocket):
 
                     if not is_configured:
                         # Demo mode
-                        await websocket.send_json({
+                        outbound.send({
                             'type': 'progress',
                             'data': {'message': 'Demo mode: Planning...', 'percentage': 20}
                         })
 
                         await asyncio.sleep(0.5)
 
-                        await websocket.send_json({
+                        outbound.send({
                             'type': 'progress',
                             'data': {'message': 'Demo mode: Executing...', 'percentage': 60}
                         })
 
                         await asyncio.sleep(0.5)
 
-                        await websocket.send_json({
+                        outbound.send({
                             'type': 'progress',
                             'data': {'message': 'Demo mode: Evaluating...', 'percentage': 90}
                         })
@@ -378,7 +746,7 @@ async def websocket_endpoint(websocket: WebSocket):
                         await asyncio.sleep(0.5)
 
                         # Send demo result
-                        await websocket.send_json({
+                        outbound.send({
                             'type': 'complete',
                             'data': {
                                 'success': True,
@@ -391,28 +759,28 @@ async def websocket_endpoint(websocket: WebSocket):
                         })
                     else:
                         # Real execution
-                        agent = GeneralPurposeAgent(verbose=False)
+                        agent = create_agent(websocket.app.state)
 
                         # Send progress updates
-                        await websocket.send_json({
+                        outbound.send({
                             'type': 'progress',
                             'data': {'message': 'Planning...', 'percentage': 20}
                         })
 
-                        evaluation = agent.run(goal)
+                        evaluation = await run_in_agent_pool(websocket.app.state, agent.run, goal)
 
-                        await websocket.send_json({
+                        outbound.send({
                             'type': 'progress',
                             'data': {'message': 'Executing...', 'percentage': 60}
                         })
 
-                        await websocket.send_json({
+                        outbound.send({
                             'type': 'progress',
                             'data': {'message': 'Evaluating...', 'percentage': 90}
                         })
 
                         # Send result
-                        await websocket.send_json({
+                        outbound.send({
                             'type': 'complete',
                             'data': {
                                 'success': evaluation.overall_success,
@@ -425,26 +793,29 @@ async def websocket_endpoint(websocket: WebSocket):
                         })
 
                 except Exception as e:
-                    await websocket.send_json({
+                    outbound.send({
                         'type': 'error',
                         'data': {'error': str(e)}
                     })
 
     except WebSocketDisconnect:
+        pass
+    finally:
         manager.disconnect(websocket)
+        await outbound.close()
 
 
 @app.get("/api/collaboration/run")
-async def run_collaboration(goal: str):
+async def run_collaboration(goal: str, request: Request):
     """Run multi-agent collaboration."""
     try:
         is_configured = is_azure_openai_configured()
 
         if not is_configured:
             # Demo mode
-            return {
-                "success": True,
-                "result": {
+            return model_response(CollaborationResponse(
+                success=True,
+                result={
                     "goal": goal,
                     "plan": {
                         "subtasks": [
@@ -461,60 +832,37 @@ async def run_collaboration(goal: str):
                         "weaknesses": ["Azure OpenAI not configured"]
                     }
                 },
-                "demo_mode": True
-            }
-
-        # Real execution
-        from src.utils.llm_client import AzureOpenAIClient
-        from src.planning import PlanningModule
-        from src.execution import ExecutionEngine
-        from src.evaluation import EvaluationModule
-        from src.tools.base import ToolRegistry
-        from src.tools import FileReadTool, FileWriteTool
-        from src.collaboration import (
-            AgentOrchestrator,
-            PlannerAgent,
-            ExecutorAgent,
-            ReviewerAgent,
-            AgentRole
-        )
+                demo_mode=True
+            ))
 
-        llm_client = AzureOpenAIClient()
-        tool_registry = ToolRegistry()
-        tool_registry.register(FileReadTool())
-        tool_registry.register(FileWriteTool())
+        # Real execution - fresh orchestrator (it records per-run messages)
+        # wired to the shared specialist agents
+        if not request.app.state.collaboration_agents:
+            raise RuntimeError("Shared LLM client failed to initialize; check server logs")
 
-        # Create orchestrator
         orchestrator = AgentOrchestrator(verbose=False)
-
-        # Create specialized agents
-        planner = PlannerAgent(PlanningModule(llm_client))
-        executor = ExecutorAgent(ExecutionEngine(llm_client, tool_registry))
-        reviewer = ReviewerAgent(EvaluationModule(llm_client))
-
-        # Register agents
-        orchestrator.register_agent('planner', planner, AgentRole.PLANNER)
-        orchestrator.register_agent('executor', executor, AgentRole.EXECUTOR)
-        orchestrator.register_agent('reviewer', reviewer, AgentRole.REVIEWER)
+        for name, (agent, role) in request.app.state.collaboration_agents.items():
+            orchestrator.register_agent(name, agent, role)
 
         # Run collaboration
-        result = orchestrator.collaborate(goal)
+        result = await run_in_agent_pool(request.app.state, orchestrator.collaborate, goal)
 
-        return {
-            "success": True,
-            "result": result,
-            "demo_mode": False
-        }
+        return model_response(CollaborationResponse(
+            success=True,
+            result=result,
+            demo_mode=False
+        ))
 
     except Exception as e:
         import traceback
-        return {
-            "success": False,
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }
+        return model_response(CollaborationResponse(
+            success=False,
+            error=str(e),
+            traceback=traceback.format_exc()
+        ))
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Per-message deflate would re-compress every broadcast frame per client
+    uvicorn.run(app, host="0.0.0.0", port=8000, ws_per_message_deflate=False)
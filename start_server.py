@@ -13,38 +13,42 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 
+_REQUIRED = (
+    'AZURE_OPENAI_API_KEY',
+    'AZURE_OPENAI_ENDPOINT',
+    'AZURE_OPENAI_DEPLOYMENT_NAME'
+)
+
+_BAR = "=" * 70
+
+
 def check_environment():
     """Check if environment variables are set."""
-    required_vars = [
-        'AZURE_OPENAI_API_KEY',
-        'AZURE_OPENAI_ENDPOINT',
-        'AZURE_OPENAI_DEPLOYMENT_NAME'
-    ]
-
-    missing_vars = [var for var in required_vars if not os.getenv(var)]
-
-    print("\n" + "=" * 70)
-    print("🚀 Agent Web Server")
-    print("=" * 70)
-
-    if missing_vars:
-        print("\n⚠️  Warning: Running in DEMO MODE")
-        print("   Missing environment variables:")
-        for var in missing_vars:
-            print(f"   - {var}")
-        print("\n   💡 To enable full functionality:")
-        print("   1. Copy .env.example to .env")
-        print("   2. Add your Azure OpenAI credentials")
-        print("   3. Restart this server")
-    else:
-        print("\n✅ Azure OpenAI configured - Full functionality enabled")
+    lines = ["", _BAR, "🚀 Agent Web Server", _BAR]
 
-    print("\n📍 Server URLs:")
-    print("   • Chat Interface:      http://localhost:8000")
-    print("   • Dashboard Interface: http://localhost:8000/dashboard")
-    print("   • Health Check:        http://localhost:8000/health")
-    print("\n⌨️  Press Ctrl+C to stop the server")
-    print("=" * 70 + "\n")
+    if all(map(os.getenv, _REQUIRED)):
+        lines.append("\n✅ Azure OpenAI configured - Full functionality enabled")
+    else:
+        lines.append("\n⚠️  Warning: Running in DEMO MODE")
+        lines.append("   Missing environment variables:")
+        lines.extend(f"   - {var}" for var in _REQUIRED if not os.getenv(var))
+        lines.append("\n   💡 To enable full functionality:")
+        lines.append("   1. Copy .env.example to .env")
+        lines.append("   2. Add your Azure OpenAI credentials")
+        lines.append("   3. Restart this server")
+
+    lines.extend([
+        "\n📍 Server URLs:",
+        "   • Chat Interface:      http://localhost:8000",
+        "   • Dashboard Interface: http://localhost:8000/dashboard",
+        "   • Health Check:        http://localhost:8000/health",
+        "\n⌨️  Press Ctrl+C to stop the server",
+        _BAR + "\n",
+    ])
+
+    # One write instead of a print() per line
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
 
 
 def main():
@@ -56,14 +60,29 @@ def main():
         check_environment()
 
         import uvicorn
-        from src.web_ui.app import app
+
+        # Multiple worker processes need an import string rather than the app object
+        workers = os.getenv('SERVER_WORKERS')
+        if workers:
+            app = "src.web_ui.app:app"
+            workers = int(workers) or os.cpu_count()
+        else:
+            from src.web_ui.app import app
 
         # Start the server
         uvicorn.run(
             app,
             host="0.0.0.0",
             port=8000,
-            log_level="info"
+            log_level="info",
+            workers=workers,
+            # uvloop/httptools cut per-request loop and parser overhead (uvloop has no Windows build)
+            loop="asyncio" if sys.platform == "win32" else "uvloop",
+            http="httptools",
+            ws="websockets",
+            # Per-message deflate would re-compress every broadcast frame per client
+            ws_per_message_deflate=False,
+            access_log=os.getenv('SERVER_ACCESS_LOG', '').lower() in ('1', 'true', 'yes')
         )
 
     except KeyboardInterrupt:
@@ -0,0 +1,91 @@
+"""
+On-disk response cache for deterministic test prompts.
+
+Repeated test runs replay cached completions instead of calling Azure OpenAI.
+Only low-temperature, non-streaming requests are cached; sampled responses
+are always fetched fresh so tests don't freeze one random completion.
+"""
+
+import functools
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+from pathlib import Path
+
+from src.utils.llm_client import AzureOpenAIClient
+
+CACHE_DIR = Path(os.getenv('LLM_TEST_CACHE_DIR', Path(__file__).parent.parent / '.cache' / 'llm_tests'))
+MAX_CACHED_TEMPERATURE = 0.1
+
+_original_chat_completion = AzureOpenAIClient.chat_completion
+
+
+def _cache_key(client, messages, temperature, max_tokens, tools, tool_choice) -> str:
+    """Hash everything that determines the completion."""
+    payload = json.dumps(
+        {
+            "model": client.deployment_name,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "tools": tools,
+            "tool_choice": tool_choice
+        },
+        sort_keys=True,
+        default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def cached_chat_completion(client, messages, temperature=None, max_tokens=None,
+                           tools=None, tool_choice=None, stream=False, request_timeout=None):
+    """
+    Drop-in replacement for AzureOpenAIClient.chat_completion with a disk cache.
+
+    Args:
+        client: AzureOpenAIClient instance
+        messages: List of message dictionaries
+        temperature: Override default temperature
+        max_tokens: Override default max tokens
+        tools: Optional list of tool definitions
+        tool_choice: Tool choice strategy
+        stream: Streaming requests bypass the cache
+        request_timeout: Per-request timeout in seconds
+
+    Returns:
+        Cached or freshly fetched response
+    """
+    effective_temperature = client.temperature if temperature is None else temperature
+
+    if stream or effective_temperature > MAX_CACHED_TEMPERATURE:
+        return _original_chat_completion(
+            client, messages, temperature=temperature, max_tokens=max_tokens,
+            tools=tools, tool_choice=tool_choice, stream=stream, request_timeout=request_timeout
+        )
+
+    key = _cache_key(client, messages, effective_temperature, max_tokens or client.max_tokens, tools, tool_choice)
+    path = CACHE_DIR / f"{key}.pkl"
+
+    if path.exists():
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+
+    response = _original_chat_completion(
+        client, messages, temperature=temperature, max_tokens=max_tokens,
+        tools=tools, tool_choice=tool_choice, request_timeout=request_timeout
+    )
+
+    # Write atomically; tests may run concurrently
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile('wb', dir=CACHE_DIR, delete=False) as f:
+        pickle.dump(response, f)
+    os.replace(f.name, path)
+
+    return response
+
+
+def install():
+    """Route AzureOpenAIClient.chat_completion through the cache (test process only)."""
+    AzureOpenAIClient.chat_completion = functools.wraps(_original_chat_completion)(cached_chat_completion)
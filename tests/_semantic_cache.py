@@ -0,0 +1,99 @@
+"""
+Semantic response cache for paraphrased interactive prompts.
+
+Prompts are embedded with an Azure OpenAI embedding deployment; a new prompt
+reuses a cached result when its cosine similarity to a previous prompt is
+above the threshold ("list first 5 primes" vs "give me five primes").
+"""
+
+import math
+import os
+from typing import Any, List, Optional, Tuple
+
+from src.utils.llm_client import AzureOpenAIClient
+from tests._llm_cache import MAX_CACHED_TEMPERATURE
+
+SIMILARITY_THRESHOLD = 0.92
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class SemanticCache:
+    """In-memory (embedding, result) store searched by cosine similarity."""
+
+    def __init__(self, client: AzureOpenAIClient, deployment: str, threshold: float = SIMILARITY_THRESHOLD):
+        """
+        Initialize semantic cache.
+
+        Args:
+            client: Azure OpenAI client used for embeddings
+            deployment: Embedding deployment name (e.g. text-embedding-3-small)
+            threshold: Minimum cosine similarity for a hit
+        """
+        self.client = client
+        self.deployment = deployment
+        self.threshold = threshold
+        self.entries: List[Tuple[List[float], str, Any]] = []
+        self._last: Optional[Tuple[str, List[float]]] = None
+
+    def _embed(self, prompt: str) -> List[float]:
+        # Reuse the embedding from the preceding lookup() when storing the same prompt
+        if self._last and self._last[0] == prompt:
+            return self._last[1]
+
+        response = self.client.client.embeddings.create(model=self.deployment, input=prompt)
+        embedding = _normalize(response.data[0].embedding)
+        self._last = (prompt, embedding)
+        return embedding
+
+    def lookup(self, prompt: str) -> Optional[Tuple[Any, str, float]]:
+        """
+        Find a cached result for a semantically similar prompt.
+
+        Args:
+            prompt: User prompt
+
+        Returns:
+            (cached result, matched prompt, similarity), or None on a miss
+        """
+        embedding = self._embed(prompt)
+        best_score, best_match = 0.0, None
+
+        for cached, cached_prompt, result in self.entries:
+            score = sum(a * b for a, b in zip(embedding, cached))
+            if score > best_score:
+                best_score, best_match = score, (result, cached_prompt, score)
+
+        return best_match if best_score >= self.threshold else None
+
+    def store(self, prompt: str, result: Any):
+        """
+        Cache a result for a prompt.
+
+        Args:
+            prompt: User prompt
+            result: Result to return for similar prompts
+        """
+        self.entries.append((self._embed(prompt), prompt, result))
+
+
+def from_env(client: AzureOpenAIClient, temperature: float) -> Optional[SemanticCache]:
+    """
+    Build a semantic cache when an embedding deployment is configured.
+
+    Sampled (high-temperature) runs are never cached.
+
+    Args:
+        client: Azure OpenAI client
+        temperature: Temperature the agent runs at
+
+    Returns:
+        SemanticCache, or None when disabled
+    """
+    deployment = os.getenv('AZURE_OPENAI_EMBEDDING_DEPLOYMENT')
+    if not deployment or temperature > MAX_CACHED_TEMPERATURE:
+        return None
+    return SemanticCache(client, deployment)